@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
 import asyncio
-import subprocess
+import grp
+import os
+import shutil
 import sys
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 class SetupChecker:
+    # Resolved executable paths, shared across checker runs
+    _paths: Dict[str, Optional[str]] = {}
+
     def __init__(self):
         self.errors = []
         self.warnings = []
 
+    def which(self, program: str) -> Optional[str]:
+        """Resolve a program on PATH, caching the result"""
+        if program not in self._paths:
+            self._paths[program] = shutil.which(program)
+        return self._paths[program]
+
     async def check_command(self, cmd: List[str], name: str) -> Tuple[bool, str]:
         """Check if a command exists and runs"""
+        # Missing binaries fail without paying for a spawn
+        path = self.which(cmd[0])
+        if path is None:
+            return False, f"{name} not found"
+
         try:
             proc = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                path,
+                *cmd[1:],
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             stdout, stderr = await proc.communicate()
             if proc.returncode != 0:
@@ -23,10 +42,33 @@ class SetupChecker:
         except FileNotFoundError:
             return False, f"{name} not found"
 
-    async def check_service(self, service: str) -> Tuple[bool, str]:
-        """Check if a systemd service is running"""
-        cmd = ["systemctl", "is-active", service]
-        return await self.check_command(cmd, f"Service {service}")
+    async def check_services(self, services: List[str]) -> List[Tuple[bool, str]]:
+        """Check if systemd services are running with a single systemctl call"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "systemctl",
+                "is-active",
+                *services,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await proc.communicate()
+        except FileNotFoundError:
+            return [
+                (False, f"Service {s} check failed: systemctl not found")
+                for s in services
+            ]
+
+        # One state per unit, in the order given
+        states = dict(zip(services, stdout.decode().split()))
+        results = []
+        for service in services:
+            state = states.get(service, "unknown")
+            if state == "active":
+                results.append((True, f"Service {service} OK"))
+            else:
+                results.append((False, f"Service {service} check failed: {state}"))
+        return results
 
     async def check_dependencies(self):
         """Check all required dependencies"""
@@ -37,22 +79,31 @@ class SetupChecker:
             (["bluetoothctl", "--version"], "Bluetoothctl"),
         ]
 
-        for cmd, name in commands:
-            ok, msg = await self.check_command(cmd, name)
-            if not ok:
-                self.errors.append(msg)
-            print(f"✓ {msg}" if ok else f"✗ {msg}")
-
         # Check services
         services = ["bluetooth", "bluealsa"]
-        for service in services:
-            ok, msg = await self.check_service(service)
+
+        # Run all probes concurrently, report in order
+        tasks = [self.check_command(cmd, name) for cmd, name in commands]
+        tasks.append(self.check_services(services))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Service results come back as one batch
+        service_results = results.pop()
+        if isinstance(service_results, Exception):
+            service_results = [service_results]
+        results.extend(service_results)
+
+        for result in results:
+            if isinstance(result, Exception):
+                result = (False, f"Check failed: {result}")
+            ok, msg = result
             if not ok:
                 self.errors.append(msg)
             print(f"✓ {msg}" if ok else f"✗ {msg}")
 
-        # Check user permissions
-        groups = subprocess.check_output(["groups"]).decode()
+        # Check user permissions from our own group list, without forking groups
+        gids = set(os.getgroups())
+        groups = {group.gr_name for group in grp.getgrall() if group.gr_gid in gids}
         if "bluetooth" not in groups:
             self.warnings.append("User not in bluetooth group")
             print("✗ Bluetooth permissions")
@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
+import heapq
 import psutil
+import sys
 import time
-import os
 from datetime import datetime
 
+# Cursor home + clear screen
+CLEAR = "\x1b[H\x1b[2J"
+
+# SoC temperature in millidegrees Celsius
+THERMAL_ZONE = "/sys/class/thermal/thermal_zone0/temp"
+
 
 def get_temp():
     """Get CPU temperature"""
     try:
-        temp = os.popen("vcgencmd measure_temp").readline()
-        return temp.replace("temp=", "").replace("'C\n", "")
-    except:
+        with open(THERMAL_ZONE) as f:
+            return f"{int(f.read()) / 1000:.1f}"
+    except (OSError, ValueError):
         return "N/A"
 
 
@@ -18,9 +25,6 @@ def monitor():
     """Monitor system stats"""
     try:
         while True:
-            # Clear screen
-            os.system("clear")
-
             # Get stats
             cpu_percent = psutil.cpu_percent(interval=1)
             memory = psutil.virtual_memory()
@@ -28,38 +32,41 @@ def monitor():
             temp = get_temp()
 
             # Format output
-            print("\033[92m=== Raspberry Pi Monitor ===\033[0m")
-            print(f"Time: {datetime.now().strftime('%H:%M:%S')}")
-            print(f"\nCPU Usage: {cpu_percent}%")
-            print(f"CPU Temp:  {temp}°C")
-            print(f"\nMemory:")
-            print(f"  Used:  {memory.percent}%")
-            print(f"  Total: {memory.total / (1024**3):.1f}GB")
-            print(f"  Free:  {memory.available / (1024**3):.1f}GB")
-            print(f"\nDisk:")
-            print(f"  Used:  {disk.percent}%")
-            print(f"  Total: {disk.total / (1024**3):.1f}GB")
-            print(f"  Free:  {disk.free / (1024**3):.1f}GB")
+            lines = [
+                "\033[92m=== Raspberry Pi Monitor ===\033[0m",
+                f"Time: {datetime.now().strftime('%H:%M:%S')}",
+                f"\nCPU Usage: {cpu_percent}%",
+                f"CPU Temp:  {temp}°C",
+                "\nMemory:",
+                f"  Used:  {memory.percent}%",
+                f"  Total: {memory.total / (1024**3):.1f}GB",
+                f"  Free:  {memory.available / (1024**3):.1f}GB",
+                "\nDisk:",
+                f"  Used:  {disk.percent}%",
+                f"  Total: {disk.total / (1024**3):.1f}GB",
+                f"  Free:  {disk.free / (1024**3):.1f}GB",
+            ]
 
             # Show running processes
-            print("\nTop Processes:")
-            processes = []
-            for proc in psutil.process_iter(
-                ["pid", "name", "cpu_percent", "memory_percent"]
-            ):
-                try:
-                    pinfo = proc.info
-                    processes.append(pinfo)
-                except:
-                    pass
+            lines.append("\nTop Processes:")
+            processes = [
+                proc.info
+                for proc in psutil.process_iter(
+                    attrs=["name", "cpu_percent", "memory_percent"], ad_value=0.0
+                )
+            ]
 
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x["cpu_percent"], reverse=True)
-            for proc in processes[:5]:
-                print(
+            # Top 5 by CPU usage
+            top = heapq.nlargest(5, processes, key=lambda x: x["cpu_percent"])
+            for proc in top:
+                lines.append(
                     f"  {proc['name'][:20]:<20} CPU: {proc['cpu_percent']:>5.1f}%  MEM: {proc['memory_percent']:>5.1f}%"
                 )
 
+            # Clear screen and draw the whole frame in one write
+            sys.stdout.write(CLEAR + "\n".join(lines) + "\n")
+            sys.stdout.flush()
+
             time.sleep(2)
 
     except KeyboardInterrupt:
@@ -6,9 +6,12 @@ setup(
     packages=find_packages("src"),
     package_dir={"": "src"},
     install_requires=[
-        "dbus-python",  # For D-Bus communication
+        "dbus-fast>=2.22; python_version >= '3.8'",  # For D-Bus communication
         "psutil",  # For system monitoring
         "asyncio",  # For async support
     ],
+    extras_require={
+        "uvloop": ["uvloop; sys_platform == 'linux'"],  # Faster event loop
+    },
     python_requires=">=3.7",
 )
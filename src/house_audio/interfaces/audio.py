@@ -1,12 +1,42 @@
 #!/usr/bin/env python3
 
 import asyncio
+import functools
 import subprocess
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import logging
 import os
 import re
-import json
+import shutil
+from .pipewire import iter_graph_changes, iter_pw_dump
+from .systemd import unit_states
+
+# wpctl status layout: " ├─ Sinks:" headers followed by
+# " │  *   46. Built-in Audio Analog Stereo   [vol: 0.40]" entries
+_WPCTL_SECTION_RE = re.compile(r"[├└]─\s+(.+?):")
+_WPCTL_ENTRY_RE = re.compile(r"│\s+\*?\s*(\d+)\.\s+(.+?)(?:\s+\[vol:[^\]]*\])?\s*$")
+_WPCTL_SECTIONS = {"Sinks": "outputs", "Sources": "inputs"}
+# wpctl get-volume output: "Volume: 0.75", with " [MUTED]" appended when muted
+_WPCTL_VOLUME_RE = re.compile(rb"Volume:\s*(\d+(?:\.\d+)?)")
+
+# PipeWire tools the interface cannot work without
+REQUIRED_TOOLS = ("pw-cli", "pw-dump", "pw-link")
+
+# Channel maps for linking a Bluetooth source to a sink
+CHANNELS_STEREO = ("FL", "FR")
+CHANNELS_MONO = ("FL",)
+
+# Volume changes smaller than this are treated as no-ops
+VOLUME_EPSILON = 1e-3
+# Window (seconds) in which rapid volume changes are coalesced
+VOLUME_DEBOUNCE = 0.03
+# Most PipeWire tool processes run at once by batched operations
+MAX_CONCURRENT_COMMANDS = 8
+
+
+def _channel_link(source: str, target: str, channel: str) -> str:
+    """Build the "source -> target" link for one channel of a route"""
+    return f"bluez_source.{source}:monitor_{channel} -> {target}:playback_{channel}"
 
 
 class AudioInterface:
@@ -18,51 +48,77 @@ class AudioInterface:
         self.outputs = {}
         self.routes = {}
         self.volumes = {}
+        self._graph_version = 0  # Bumped by pw-mon on graph changes
+        self._outputs_version = None  # Graph version self.outputs reflects
+        self._graph_monitor = None
+        self._graph_live = False  # pw-mon is running and has reported the graph
+        # Resolve once so a missing wpctl doesn't cost a failed spawn per call
+        self._has_wpctl = shutil.which("wpctl") is not None
+        self._pending_volumes = {}  # device -> debounced set_volume task
+        self._exec_sem = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
 
     async def setup(self):
         """Initialize audio interface"""
         try:
-            # Verify PipeWire is running
+            # Verify tools are installed and PipeWire is running
+            self._check_dependencies()
             await self._verify_services()
 
-            # Initialize PipeWire connection
-            proc = await asyncio.create_subprocess_exec(
-                "pw-cli",
-                "info",
-                "0",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            if proc.returncode != 0:
-                raise RuntimeError("Failed to connect to PipeWire")
+            # Watch for graph changes so discovery results can be cached
+            self._graph_monitor = asyncio.create_task(self._monitor_graph())
 
-            # Discover devices
+            # Discover devices; pw-dump fails if PipeWire can't be reached,
+            # so this doubles as the connection check
             await self.discover_devices()
 
         except Exception as e:
-            self.logger.error(f"Setup failed: {e}")
+            self.logger.error("Setup failed: %s", e)
             raise
 
-    async def discover_devices(self) -> Dict:
+    def _check_dependencies(self):
+        """Verify required PipeWire tools are on PATH (no subprocess needed)"""
+        missing = [tool for tool in REQUIRED_TOOLS if shutil.which(tool) is None]
+        if missing:
+            raise RuntimeError(f"Missing required tools: {', '.join(missing)}")
+
+    def _graph_monitored(self) -> bool:
+        """Check whether pw-mon is tracking graph changes"""
+        # Not until pw-mon has actually reported something: the task may not
+        # have run yet, or pw-mon may be missing
+        return (
+            self._graph_live
+            and self._graph_monitor is not None
+            and not self._graph_monitor.done()
+        )
+
+    async def _monitor_graph(self):
+        """Invalidate cached devices whenever PipeWire objects come or go"""
+        try:
+            async for _ in iter_graph_changes():
+                self._graph_version += 1
+                self._graph_live = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error("Graph monitoring unavailable: %s", e)
+        finally:
+            self._graph_live = False
+
+    async def discover_devices(self, force: bool = False) -> Dict:
         """Discover available audio devices"""
+        monitored = self._graph_monitored()
+        if not force and monitored and self._outputs_version == self._graph_version:
+            return self.outputs
+
         devices = {}
-        retry_count = 3
+        version = self._graph_version
+        # Without pw-mon nothing tells us when sinks appear, so keep retrying
+        retry_count = 1 if monitored else 3
 
         while retry_count > 0:
             try:
-                # Get PipeWire sinks
-                proc = await asyncio.create_subprocess_exec(
-                    "pw-dump",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await proc.communicate()
-
-                # Parse JSON output
-                nodes = json.loads(stdout.decode())
-
-                for node in nodes:
+                # Stream PipeWire objects, keeping only sinks
+                async for node in iter_pw_dump():
                     if node.get("type") == "PipeWire:Interface:Node":
                         info = node.get("info", {})
                         props = info.get("props", {})
@@ -91,12 +147,15 @@ class AudioInterface:
                 if devices:  # If we found devices, break the retry loop
                     break
 
-                self.logger.warning("No audio devices found, retrying...")
                 retry_count -= 1
-                await asyncio.sleep(1)
+                if retry_count > 0:
+                    self.logger.warning("No audio devices found, retrying...")
+                    await asyncio.sleep(1)
+                else:
+                    self.logger.warning("No audio devices found")
 
             except Exception as e:
-                self.logger.error(f"Device discovery failed: {e}")
+                self.logger.error("Device discovery failed: %s", e)
                 retry_count -= 1
                 if retry_count > 0:
                     await asyncio.sleep(1)
@@ -104,6 +163,7 @@ class AudioInterface:
                 raise
 
         self.outputs = devices
+        self._outputs_version = version
         return devices
 
     async def create_route(self, source: str, target: str) -> str:
@@ -119,41 +179,20 @@ class AudioInterface:
             target_info = self.outputs[target]
             is_mono = target_info.get("is_mono", False)
 
-            # Link Bluetooth source to target sink
-            links = []
-
-            # Left channel
-            proc = await asyncio.create_subprocess_exec(
-                "pw-link",
-                f"bluez_source.{source}:monitor_FL",
-                f"{target}:playback_FL",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
-            links.append(f"bluez_source.{source}:monitor_FL -> {target}:playback_FL")
-
-            # Right channel (if stereo)
-            if not is_mono:
-                proc = await asyncio.create_subprocess_exec(
-                    "pw-link",
-                    f"bluez_source.{source}:monitor_FR",
-                    f"{target}:playback_FR",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await proc.communicate()
-                links.append(
-                    f"bluez_source.{source}:monitor_FR -> {target}:playback_FR"
-                )
+            # Link Bluetooth source to target sink, one link per channel
+            channels = CHANNELS_MONO if is_mono else CHANNELS_STEREO
+            links = [_channel_link(source, target, ch) for ch in channels]
 
             # For mono devices, mix down stereo to mono
-            elif is_mono:
+            if is_mono:
                 self.logger.info(
-                    f"Mono device detected: {target}, mixing stereo to mono"
+                    "Mono device detected: %s, mixing stereo to mono", target
                 )
                 # The right channel is automatically mixed by PipeWire
 
+            # Create all links in one round-trip
+            await self._create_links(links)
+
             self.routes[route_id] = {
                 "source": source,
                 "outputs": [target],
@@ -164,35 +203,52 @@ class AudioInterface:
             return route_id
 
         except Exception as e:
-            self.logger.error(f"Failed to create route: {e}")
+            self.logger.error("Failed to create route: %s", e)
             raise
 
-    async def verify_route(self, route_id: str) -> bool:
+    async def _snapshot_links(self) -> FrozenSet[bytes]:
+        """Get all current links as b"source -> target" strings"""
+        proc = await asyncio.create_subprocess_exec(
+            "pw-link",
+            "-l",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        # Output lists each port followed by indented "|-> target" lines;
+        # parsed as bytes while pw-link is still writing
+        links = set()
+        port = None
+        async for line in proc.stdout:
+            if not line.startswith(b" "):
+                port = line.strip()
+            elif port and line.lstrip().startswith(b"|->"):
+                links.add(port + b" -> " + line.split(b"|->", 1)[1].strip())
+        await proc.wait()
+        return frozenset(links)
+
+    async def verify_route(
+        self, route_id: str, links: Optional[FrozenSet[bytes]] = None
+    ) -> bool:
         """Verify route is working correctly"""
         try:
             route = self.routes.get(route_id)
             if not route:
                 return False
 
+            if links is None:
+                links = await self._snapshot_links()
+
             # Check each link
             for link in route["links"]:
-                source, target = link.split(" -> ")
-                proc = await asyncio.create_subprocess_exec(
-                    "pw-link",
-                    "-l",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await proc.communicate()
-
-                if link not in stdout.decode():
-                    self.logger.error(f"Link verification failed: {link}")
+                if link.encode() not in links:
+                    self.logger.error("Link verification failed: %s", link)
                     return False
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Route verification failed: {e}")
+            self.logger.error("Route verification failed: %s", e)
             return False
 
     async def repair_route(self, route_id: str) -> bool:
@@ -217,25 +273,43 @@ class AudioInterface:
             return await self.verify_route(new_route_id)
 
         except Exception as e:
-            self.logger.error(f"Route repair failed: {e}")
+            self.logger.error("Route repair failed: %s", e)
             return False
 
     async def _remove_route_links(self, route: Dict):
         """Remove all links for a route"""
-        for link in route.get("links", []):
-            try:
-                source, target = link.split(" -> ")
-                proc = await asyncio.create_subprocess_exec(
-                    "pw-link",
-                    "-d",
-                    source,
-                    target,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await proc.communicate()
-            except Exception as e:
-                self.logger.error(f"Failed to remove link {link}: {e}")
+        await self._remove_links(route.get("links", []))
+
+    async def _run(self, *cmd: str) -> subprocess.CompletedProcess:
+        """Run a short command in a worker thread
+
+        Avoids setting up asyncio pipe transports and child watching for each
+        spawn. Gathered calls are capped at MAX_CONCURRENT_COMMANDS processes.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._exec_sem:
+            return await loop.run_in_executor(
+                None, functools.partial(subprocess.run, cmd, capture_output=True)
+            )
+
+    async def _pw_link(self, *args: str) -> bool:
+        """Run pw-link and report whether it succeeded"""
+        result = await self._run("pw-link", *args)
+        return result.returncode == 0
+
+    async def _create_links(self, links: List[str]):
+        """Create links concurrently"""
+        await asyncio.gather(*(self._pw_link(*link.split(" -> ")) for link in links))
+
+    async def _remove_links(self, links: List[str]):
+        """Remove links concurrently, logging any that fail"""
+        results = await asyncio.gather(
+            *(self._pw_link("-d", *link.split(" -> ")) for link in links),
+            return_exceptions=True,
+        )
+        for link, result in zip(links, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to remove link %s: %s", link, result)
 
     async def add_output_to_route(self, source: str, new_target: str):
         """Add another output to an existing route"""
@@ -251,35 +325,17 @@ class AudioInterface:
 
         try:
             # Create additional links
-            proc = await asyncio.create_subprocess_exec(
-                "pw-link",
-                f"bluez_source.{source}:monitor_FL",
-                f"{new_target}:playback_FL",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
-
-            proc = await asyncio.create_subprocess_exec(
-                "pw-link",
-                f"bluez_source.{source}:monitor_FR",
-                f"{new_target}:playback_FR",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
+            is_mono = self.outputs.get(new_target, {}).get("is_mono", False)
+            channels = CHANNELS_MONO if is_mono else CHANNELS_STEREO
+            links = [_channel_link(source, new_target, ch) for ch in channels]
+            await self._create_links(links)
 
             # Update route info
             route["outputs"].append(new_target)
-            route["links"].extend(
-                [
-                    f"bluez_source.{source}:monitor_FL -> {new_target}:playback_FL",
-                    f"bluez_source.{source}:monitor_FR -> {new_target}:playback_FR",
-                ]
-            )
+            route["links"].extend(links)
 
         except Exception as e:
-            self.logger.error(f"Failed to add output to route: {e}")
+            self.logger.error("Failed to add output to route: %s", e)
             raise
 
     async def set_volume(self, device: str, volume: float):
@@ -287,95 +343,90 @@ class AudioInterface:
         if not 0 <= volume <= 1:
             raise ValueError("Volume must be between 0 and 1")
 
+        # Coalesce bursts (e.g. slider drags): a newer request for the same
+        # device supersedes one that hasn't been applied yet, even when it
+        # returns to the volume already applied
+        pending = self._pending_volumes.pop(device, None)
+        if pending:
+            pending.cancel()
+
+        # Nothing to do if the device is already at this volume
+        if abs(self.volumes.get(device, -1.0) - volume) < VOLUME_EPSILON:
+            return
+
+        task = asyncio.ensure_future(self._apply_volume(device, volume))
+        self._pending_volumes[device] = task
         try:
-            # Try wpctl first (more reliable)
-            proc = await asyncio.create_subprocess_exec(
-                "wpctl",
-                "set-volume",
-                device,
-                str(volume),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
+            await task
+        except asyncio.CancelledError:
+            if self._pending_volumes.get(device) is not task:
+                return  # Superseded by a newer volume
+            raise
+        finally:
+            if self._pending_volumes.get(device) is task:
+                del self._pending_volumes[device]
+
+    async def _apply_volume(self, device: str, volume: float):
+        """Apply volume after the debounce window"""
+        await asyncio.sleep(VOLUME_DEBOUNCE)
 
-            if proc.returncode == 0:
-                self.volumes[device] = volume
-                return
+        try:
+            # Try wpctl first (more reliable)
+            if self._has_wpctl:
+                result = await self._run("wpctl", "set-volume", device, str(volume))
+                if result.returncode == 0:
+                    self.volumes[device] = volume
+                    return
 
             # Fallback to pw-cli
-            proc = await asyncio.create_subprocess_exec(
-                "pw-cli",
-                "set-param",
-                device,
-                "Props",
-                f'{{"volume": {volume}}}',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            await self._run(
+                "pw-cli", "set-param", device, "Props", f'{{"volume": {volume}}}'
             )
-            await proc.communicate()
 
             self.volumes[device] = volume
 
         except Exception as e:
-            self.logger.error(f"Failed to set volume: {e}")
+            self.logger.error("Failed to set volume: %s", e)
             raise
 
     async def get_volume(self, device: str) -> float:
         """Get current volume from PipeWire"""
         try:
             # Try wpctl first
-            proc = await asyncio.create_subprocess_exec(
-                "wpctl",
-                "get-volume",
-                device,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-
-            if proc.returncode == 0:
-                # Parse volume from wpctl output (format: "Volume: 0.75")
-                volume_str = stdout.decode().strip().split()[-1]
-                return float(volume_str)
-
-            # Fallback to pw-dump
-            proc = await asyncio.create_subprocess_exec(
-                "pw-dump",
-                device,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-
-            # Parse volume from PipeWire dump
-            data = json.loads(stdout.decode())
-            for node in data:
-                if str(node.get("id")) == device:
-                    props = node.get("info", {}).get("params", {}).get("Props", {})
-                    if "volume" in props:
-                        return float(props["volume"])
+            if self._has_wpctl:
+                result = await self._run("wpctl", "get-volume", device)
+                match = _WPCTL_VOLUME_RE.search(result.stdout)
+                if result.returncode == 0 and match:
+                    return float(match.group(1))
+
+            # Fallback to pw-dump of just this node, stopping at the match
+            nodes = iter_pw_dump(device)
+            try:
+                async for node in nodes:
+                    if str(node.get("id")) != device:
+                        continue
+                    # Props is a list of param objects
+                    params = node.get("info", {}).get("params", {}).get("Props", [])
+                    for props in params:
+                        if "volume" in props:
+                            return float(props["volume"])
+                    break
+            finally:
+                await nodes.aclose()
 
             return self.volumes.get(device, 0.0)
 
         except Exception as e:
-            self.logger.error(f"Failed to get volume: {e}")
+            self.logger.error("Failed to get volume: %s", e)
             return 0.0
 
     async def set_default_output(self, device: str) -> bool:
         """Set default output device"""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "wpctl",
-                "set-default",
-                device,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
-            return proc.returncode == 0
+            result = await self._run("wpctl", "set-default", device)
+            return result.returncode == 0
         except Exception as e:
-            self.logger.error(f"Failed to set default output: {e}")
+            self.logger.error("Failed to set default output: %s", e)
             return False
 
     async def get_device_status(self) -> Dict:
@@ -385,35 +436,44 @@ class AudioInterface:
                 "wpctl",
                 "status",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            stdout, _ = await proc.communicate()
 
-            status = stdout.decode()
-            devices = {}
-
-            # Parse wpctl status output
+            # Parse wpctl status as it is printed, starting each volume
+            # query as soon as its entry has been seen
+            entries = []
+            queries = []
             current_section = None
-            for line in status.split("\n"):
-                if "Sinks:" in line:
-                    current_section = "outputs"
-                elif "Sources:" in line:
-                    current_section = "inputs"
-                elif line.strip() and current_section:
-                    if "├" in line or "└" in line:
-                        parts = line.strip().split()
-                        device_id = parts[1]
-                        name = " ".join(parts[2:])
-                        devices[device_id] = {
-                            "name": name,
-                            "type": current_section,
-                            "volume": await self.get_volume(device_id),
-                        }
+            async for raw in proc.stdout:
+                line = raw.decode()
+                header = _WPCTL_SECTION_RE.search(line)
+                if header:
+                    current_section = _WPCTL_SECTIONS.get(header.group(1))
+                elif current_section:
+                    entry = _WPCTL_ENTRY_RE.search(line)
+                    if entry:
+                        entries.append(
+                            (entry.group(1), entry.group(2), current_section)
+                        )
+                        queries.append(
+                            asyncio.ensure_future(self.get_volume(entry.group(1)))
+                        )
+            await proc.wait()
+
+            volumes = await asyncio.gather(*queries)
+
+            devices = {}
+            for (device_id, name, section), volume in zip(entries, volumes):
+                devices[device_id] = {
+                    "name": name,
+                    "type": section,
+                    "volume": volume,
+                }
 
             return devices
 
         except Exception as e:
-            self.logger.error(f"Failed to get device status: {e}")
+            self.logger.error("Failed to get device status: %s", e)
             return {}
 
     async def get_status(self) -> Dict:
@@ -425,10 +485,16 @@ class AudioInterface:
             "mode": self.mode,
         }
 
-        # Add route health status
+        # Add route health status, checked against a single link snapshot
         route_health = {}
-        for route_id in self.routes:
-            route_health[route_id] = await self.verify_route(route_id)
+        if self.routes:
+            try:
+                links = await self._snapshot_links()
+            except Exception as e:
+                self.logger.error("Route verification failed: %s", e)
+                links = frozenset()
+            for route_id in self.routes:
+                route_health[route_id] = await self.verify_route(route_id, links)
         status["route_health"] = route_health
 
         return status
@@ -436,41 +502,31 @@ class AudioInterface:
     async def _verify_services(self):
         """Verify required services are running"""
         required = ["pipewire", "pipewire-pulse", "wireplumber"]
+        states = await unit_states(required, user=True)
         for service in required:
-            proc = await asyncio.create_subprocess_exec(
-                "systemctl",
-                "--user",
-                "is-active",
-                service,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            if stdout.decode().strip() != "active":
+            if states.get(service) != "active":
                 raise RuntimeError(f"Service {service} not running")
 
     async def cleanup(self):
         """Clean up resources"""
-        # Remove all links
-        for route_id, route in self.routes.items():
-            for link in route.get("links", []):
-                try:
-                    source, target = link.split(" -> ")
-                    proc = await asyncio.create_subprocess_exec(
-                        "pw-link",
-                        "-d",
-                        source,
-                        target,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    await proc.communicate()
-                except Exception as e:
-                    self.logger.error(f"Failed to remove link {link}: {e}")
-
-        # Reset volumes
-        for device in self.volumes:
+        # Stop graph monitoring
+        if self._graph_monitor:
+            self._graph_monitor.cancel()
             try:
-                await self.set_volume(device, 0)
-            except Exception as e:
-                self.logger.error(f"Failed to reset volume for {device}: {e}")
+                await self._graph_monitor
+            except asyncio.CancelledError:
+                pass
+
+        # Remove all links at once
+        links = [link for route in self.routes.values() for link in route["links"]]
+        await self._remove_links(links)
+
+        # Reset volumes at once
+        devices = list(self.volumes)
+        results = await asyncio.gather(
+            *(self.set_volume(device, 0) for device in devices),
+            return_exceptions=True,
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to reset volume for %s: %s", device, result)
@@ -1,9 +1,53 @@
 import asyncio
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Pattern
 import logging
-import subprocess
 import re
-import json
+import time
+
+from .pipewire import iter_graph_changes, iter_pw_dump
+from .systemd import unit_states
+
+try:
+    from . import bluez
+except ImportError:  # dbus-fast not installed, fall back to bluetoothctl
+    bluez = None
+
+# Colour codes and readline prompt markers in bluetoothctl output
+_BTCTL_ESCAPES_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|[\x01\x02]")
+# Reply to the "version" command queued after synchronous commands
+_BTCTL_DONE_RE = re.compile(r"^Version \d")
+# Final line of commands that wait on bluetoothd, e.g. "Connection successful",
+# "Failed to pair: ...", "Device XX not available" or "Agent registered"
+_BTCTL_RESULT_RE = re.compile(r"succe|^Failed|not available|removed|registered", re.I)
+
+# "Device AA:BB:CC:DD:EE:FF Name" lines from "devices"
+_DEVICE_RE = re.compile(
+    r"^[ \t]*Device[ \t]+([0-9A-F]{2}(?::[0-9A-F]{2}){5})[ \t]+(.+?)[ \t]*$",
+    re.I | re.M,
+)
+# "Key: value" lines from "info"
+_KV_RE = re.compile(r"^[ \t]*([^:\n]+?)[ \t]*:[ \t]*(.*?)[ \t]*$", re.M)
+# RSSI value from "info": "-60", or "0xffffffc4 (-60)" on newer BlueZ
+_RSSI_RE = re.compile(r"(?:^|\()(-?\d+)\)?$")
+
+# Signal strength (dBm) below which a connection is considered poor
+WEAK_RSSI = -80
+
+# How long (seconds) parsed bluetoothctl info output is reused
+INFO_MAX_AGE = 2.0
+
+# How long (seconds) starting a bluetoothctl session and its agent may take
+BTCTL_OPEN_TIMEOUT = 15.0
+
+# How long (seconds) to wait on pw-dump before reusing the last active devices
+ACTIVE_DEVICES_TIMEOUT = 2.0
+
+
+def _rate_rssi(rssi: Optional[int]) -> str:
+    """Rate a signal strength; BlueZ often reports none for connected devices"""
+    if rssi is None:
+        return "unknown"
+    return "good" if rssi > WEAK_RSSI else "poor"
 
 
 class BluetoothInterface:
@@ -14,6 +58,21 @@ class BluetoothInterface:
         self.devices = {}
         self.audio_devices = {}  # Devices with A2DP profile
         self._monitor_task = None
+        self._graph_monitor = None
+        self._graph_version = 0  # Bumped by pw-mon on graph changes
+        self._active = []  # Cached result of get_active_devices
+        self._active_version = None  # Graph version self._active reflects
+        self._bus = None  # BlueZ D-Bus connection, None when using bluetoothctl
+        self._adapter = None
+        self._managed = {}  # BlueZ objects: path -> interface -> properties
+        self._btctl = None  # Long-running bluetoothctl session
+        self._btctl_lock = asyncio.Lock()
+        self._info_cache = {}  # mac -> (monotonic time, parsed info)
+        self._changed = asyncio.Event()  # Set when BlueZ reports device changes
+        self.on_change = None  # Optional callback for the same changes
+        self._weak = set()  # Connected devices currently below WEAK_RSSI
+        self._active_set = set()  # Connected audio devices, kept from signals
+        self._signal_quality = {}  # Cached get_status signal quality
 
     async def setup(self):
         """Initialize Bluetooth interface"""
@@ -21,12 +80,20 @@ class BluetoothInterface:
             # Verify PipeWire Bluetooth is running
             await self._verify_services()
 
+            # Talk to BlueZ directly when D-Bus is available
+            await self._connect_bus()
+
             # Set up pairing agent
             await self._setup_agent()
 
             # Make discoverable
             await self.set_discoverable(True)
 
+            # Without BlueZ signals, watch for graph changes so active
+            # devices can be cached
+            if not self._bus:
+                self._graph_monitor = asyncio.create_task(self._monitor_graph())
+
             # Get initial device list
             await self.scan_devices()
 
@@ -41,20 +108,29 @@ class BluetoothInterface:
         """Cleanup resources"""
         try:
             # Stop monitoring
-            if self._monitor_task:
-                self._monitor_task.cancel()
-                try:
-                    await self._monitor_task
-                except asyncio.CancelledError:
-                    pass
+            for task in (self._monitor_task, self._graph_monitor):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
 
             # Turn off discoverable
             await self.set_discoverable(False)
 
-            # Disconnect devices
+            # Disconnect devices at once
             active = await self.get_active_devices()
-            for mac in active:
-                await self.disconnect_device(mac)
+            await asyncio.gather(
+                *(self.disconnect_device(mac) for mac in active),
+                return_exceptions=True,
+            )
+
+            # Closing the bus or session also releases our pairing agent
+            if self._bus:
+                self._bus.disconnect()
+                self._bus = None
+            await self._close_btctl()
 
         except Exception as e:
             self.logger.error(f"Cleanup failed: {e}")
@@ -62,90 +138,201 @@ class BluetoothInterface:
     async def _verify_services(self):
         """Verify required services are running"""
         try:
-            # Check PipeWire services
-            for service in ["pipewire", "pipewire-pulse", "wireplumber"]:
-                proc = await asyncio.create_subprocess_exec(
-                    "systemctl",
-                    "--user",
-                    "is-active",
-                    service,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await proc.communicate()
-                if stdout.decode().strip() != "active":
+            # Check PipeWire (user) and Bluetooth (system) services together
+            services = ["pipewire", "pipewire-pulse", "wireplumber"]
+            user_states, system_states = await asyncio.gather(
+                unit_states(services, user=True),
+                unit_states(["bluetooth"]),
+            )
+
+            for service in services:
+                if user_states.get(service) != "active":
                     raise RuntimeError(f"Service {service} not running")
 
-            # Check Bluetooth service
-            proc = await asyncio.create_subprocess_exec(
-                "systemctl",
-                "is-active",
-                "bluetooth",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            if stdout.decode().strip() != "active":
+            if system_states.get("bluetooth") != "active":
                 raise RuntimeError("Bluetooth service not running")
 
         except Exception as e:
             self.logger.error(f"Service verification failed: {e}")
             raise
 
-    async def _setup_agent(self):
-        """Configure Bluetooth agent for pairing"""
+    async def _connect_bus(self):
+        """Connect to BlueZ over D-Bus, falling back to bluetoothctl"""
+        if bluez is None:
+            self.logger.info("dbus-fast not installed, using bluetoothctl")
+            return
+
+        bus = None
         try:
-            # Use async subprocess for better error handling
-            # Remove existing agents
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "agent",
-                "off",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
-
-            # Set up DisplayOnly agent for PIN code pairing
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "agent",
-                "DisplayOnly",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await proc.communicate()
-            if proc.returncode != 0:
-                self.logger.error(f"Failed to set agent mode: {stderr.decode()}")
-                # Continue anyway - some systems don't support DisplayOnly
-                self.logger.info("Falling back to NoInputNoOutput agent")
-                proc = await asyncio.create_subprocess_exec(
-                    "bluetoothctl",
-                    "agent",
-                    "NoInputNoOutput",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+            bus = await bluez.connect()
+            # Subscribe before the initial sync so no change is missed; from
+            # then on the signals keep self._managed current
+            bus.add_message_handler(self._on_bus_message)
+            await bluez.add_match(bus, bluez.DEVICE_CHANGES_RULE)
+            await bluez.add_match(bus, bluez.OBJECT_CHANGES_RULE)
+            objects = await bluez.get_managed_objects(bus)
+            adapter = bluez.find_adapter(objects)
+            if adapter is None:
+                raise RuntimeError("no Bluetooth adapter found")
+        except Exception as e:
+            self.logger.warning(f"BlueZ D-Bus unavailable, using bluetoothctl: {e}")
+            if bus:
+                bus.disconnect()
+            return
+
+        self._bus, self._adapter, self._managed = bus, adapter, objects
+
+    def _device_path(self, mac: str) -> Optional[str]:
+        """Get the BlueZ object path of a known device"""
+        # Paths are derived from the address, so no search is needed
+        path = bluez.device_path(self._adapter, mac)
+        if bluez.DEVICE_INTERFACE in self._managed.get(path, {}):
+            return path
+        return None
+
+    def _device_props(self, path: str) -> Dict:
+        """Get the cached Device1 properties of a BlueZ object"""
+        return self._managed.get(path, {}).get(bluez.DEVICE_INTERFACE, {})
+
+    async def _btcmd(
+        self, command: str, until: Optional[Pattern] = None, timeout: float = 10.0
+    ) -> str:
+        """Run a command in the shared bluetoothctl session and return its output
+
+        Output is collected up to the line matching ``until``. Commands that
+        bluetoothd answers asynchronously need a pattern for their result;
+        otherwise a trailing ``version`` command marks the end of the reply.
+        """
+        async with self._btctl_lock:
+            try:
+                await self._ensure_btctl()
+                return await asyncio.wait_for(
+                    self._exchange(self._btctl, command, until), timeout
                 )
-                stdout, stderr = await proc.communicate()
-                if proc.returncode != 0:
-                    self.logger.error(
-                        f"Failed to set fallback agent: {stderr.decode()}"
-                    )
-                    return False
+            except (Exception, asyncio.CancelledError):
+                # Output may now be out of step with our commands, start over
+                await self._close_btctl()
+                raise
+
+    async def _ensure_btctl(self):
+        """Start the shared bluetoothctl session if it isn't running
+
+        Must be called with _btctl_lock held.
+        """
+        if self._btctl is None or self._btctl.returncode is not None:
+            self._btctl = await asyncio.wait_for(self._open_btctl(), BTCTL_OPEN_TIMEOUT)
+
+    async def _open_btctl(self):
+        """Start a bluetoothctl session with a pairing agent registered"""
+        proc = await asyncio.create_subprocess_exec(
+            "bluetoothctl",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            # Wait until it has found the controller
+            for _ in range(10):
+                if "Controller" in await self._exchange(proc, "show"):
+                    break
+                await asyncio.sleep(0.5)
+
+            # The agent lives as long as the session that registered it, so
+            # every new session needs one, including after a failed command
+            await self._register_btctl_agent(proc)
+            return proc
+        except (Exception, asyncio.CancelledError):
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            raise
 
-            # Set as default
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "default-agent",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+    async def _register_btctl_agent(self, proc) -> bool:
+        """Register a pairing agent in a bluetoothctl session"""
+        await self._exchange(proc, "agent off", _BTCTL_RESULT_RE)
+
+        # Set up DisplayOnly agent for PIN code pairing
+        output = await self._exchange(proc, "agent DisplayOnly", _BTCTL_RESULT_RE)
+        if "Failed" in output:
+            self.logger.error(f"Failed to set agent mode: {output}")
+            # Continue anyway - some systems don't support DisplayOnly
+            self.logger.info("Falling back to NoInputNoOutput agent")
+            output = await self._exchange(
+                proc, "agent NoInputNoOutput", _BTCTL_RESULT_RE
             )
-            stdout, stderr = await proc.communicate()
-            if proc.returncode != 0:
-                self.logger.error(f"Failed to set default agent: {stderr.decode()}")
-                # Not a fatal error - continue
-                self.logger.warning("Agent setup incomplete but continuing")
+            if "Failed" in output:
+                self.logger.error(f"Failed to set fallback agent: {output}")
+                return False
+
+        # Set as default
+        output = await self._exchange(proc, "default-agent", _BTCTL_RESULT_RE)
+        if "Failed" in output:
+            self.logger.error(f"Failed to set default agent: {output}")
+            # Not a fatal error - continue
+            self.logger.warning("Agent setup incomplete but continuing")
+
+        return True
+
+    async def _exchange(
+        self, proc, command: str, until: Optional[Pattern] = None
+    ) -> str:
+        """Write a command to bluetoothctl and read its reply"""
+        proc.stdin.write(f"{command}\n".encode())
+        if until is None:
+            proc.stdin.write(b"version\n")
+            until = _BTCTL_DONE_RE
+        await proc.stdin.drain()
+
+        lines = []
+        while True:
+            raw = await proc.stdout.readline()
+            if not raw:
+                raise ConnectionError("bluetoothctl exited")
+            # Keep only what follows the last prompt redraw on the line
+            line = _BTCTL_ESCAPES_RE.sub("", raw.decode(errors="replace"))
+            line = line.split("\r")[-1].strip()
+
+            if line.endswith("(yes/no):"):
+                # Accept agent prompts, as the D-Bus pairing agent does
+                proc.stdin.write(b"yes\n")
+                await proc.stdin.drain()
+                continue
+            # Skip prompts, echoed commands and [CHG]/[NEW]/[DEL] events
+            if not line or line.startswith("["):
+                continue
+
+            lines.append(line)
+            if until.search(line):
+                return "\n".join(lines)
+
+    async def _close_btctl(self):
+        """Stop the bluetoothctl session"""
+        proc, self._btctl = self._btctl, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.write(b"quit\n")
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), 2.0)
+        except Exception:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+    async def _setup_agent(self):
+        """Configure Bluetooth agent for pairing"""
+        try:
+            if self._bus:
+                await bluez.register_agent(self._bus, bluez.PairingAgent())
+                return True
 
+            # Starting the shared bluetoothctl session registers the agent
+            async with self._btctl_lock:
+                await self._ensure_btctl()
             return True
         except Exception as e:
             self.logger.error(f"Failed to setup agent: {e}")
@@ -154,20 +341,37 @@ class BluetoothInterface:
     async def set_discoverable(self, enabled: bool):
         """Set discoverable mode"""
         try:
+            if self._bus:
+                if enabled:
+                    # Set no timeout before enabling
+                    await bluez.set_property(
+                        self._bus,
+                        self._adapter,
+                        bluez.ADAPTER_INTERFACE,
+                        "DiscoverableTimeout",
+                        "u",
+                        0,
+                    )
+                for prop in ("Discoverable", "Pairable"):
+                    await bluez.set_property(
+                        self._bus,
+                        self._adapter,
+                        bluez.ADAPTER_INTERFACE,
+                        prop,
+                        "b",
+                        enabled,
+                    )
+                return True
+
             mode = "on" if enabled else "off"
-            subprocess.run(
-                ["bluetoothctl", "discoverable", mode], check=True, capture_output=True
-            )
-            subprocess.run(
-                ["bluetoothctl", "pairable", mode], check=True, capture_output=True
-            )
+            commands = [f"discoverable {mode}", f"pairable {mode}"]
             if enabled:
                 # Set no timeout when enabling
-                subprocess.run(
-                    ["bluetoothctl", "discoverable-timeout", "0"],
-                    check=True,
-                    capture_output=True,
-                )
+                commands.append("discoverable-timeout 0")
+            for command in commands:
+                output = await self._btcmd(command, _BTCTL_RESULT_RE)
+                if "Failed" in output:
+                    raise RuntimeError(output)
             return True
         except Exception as e:
             logging.error(f"Failed to set discoverable mode: {e}")
@@ -176,17 +380,27 @@ class BluetoothInterface:
     async def scan_devices(self) -> Dict[str, Dict]:
         """Scan for Bluetooth audio devices"""
         try:
-            # Get connected devices from bluetoothctl
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl", "devices", stdout=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
+            if self._bus:
+                # Filter the signal-maintained object cache in one pass,
+                # no round trip
+                self.audio_devices = {
+                    bluez.path_to_mac(path): bluez.device_summary(
+                        interfaces[bluez.DEVICE_INTERFACE]
+                    )
+                    for path, interfaces in self._managed.items()
+                    if bluez.is_audio_device(interfaces.get(bluez.DEVICE_INTERFACE, {}))
+                }
+                self._refresh_device_state()
+                return self.audio_devices
 
-            devices = self._parse_bluetoothctl_devices(stdout.decode())
+            # Get connected devices from bluetoothctl
+            devices = self._parse_bluetoothctl_devices(await self._btcmd("devices"))
 
             # Check which devices support A2DP
-            for mac in devices:
-                info = await self._get_device_info(mac)
+            infos = await asyncio.gather(
+                *(self._get_device_info(mac) for mac in devices)
+            )
+            for mac, info in zip(devices, infos):
                 if "Audio" in info.get("Class", ""):
                     self.audio_devices[mac] = {**devices[mac], **info}
 
@@ -198,36 +412,21 @@ class BluetoothInterface:
 
     def _parse_bluetoothctl_devices(self, output: str) -> Dict[str, Dict]:
         """Parse bluetoothctl devices output"""
-        devices = {}
-        for line in output.split("\n"):
-            if not line.strip():
-                continue
-            parts = line.strip().split(" ", 2)
-            if len(parts) >= 3:
-                mac = parts[1]
-                name = parts[2]
-                devices[mac] = {
-                    "name": name,
-                    "mac": mac,
-                    "connected": False,
-                    "trusted": False,
-                }
-        return devices
+        return {
+            mac: {"name": name, "mac": mac, "connected": False, "trusted": False}
+            for mac, name in _DEVICE_RE.findall(output)
+        }
 
-    async def _get_device_info(self, mac: str) -> Dict:
-        """Get detailed device info"""
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl", "info", mac, stdout=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
+    async def _get_device_info(self, mac: str, max_age: float = INFO_MAX_AGE) -> Dict:
+        """Get detailed device info, reusing output parsed in the last max_age seconds"""
+        cached = self._info_cache.get(mac)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
 
-            info = {}
-            for line in stdout.decode().split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    info[key.strip()] = value.strip()
+        try:
+            info = dict(_KV_RE.findall(await self._btcmd(f"info {mac}")))
 
+            self._info_cache[mac] = (time.monotonic(), info)
             return info
 
         except Exception as e:
@@ -237,64 +436,59 @@ class BluetoothInterface:
     async def connect_device(self, mac: str) -> bool:
         """Connect to a Bluetooth device"""
         try:
-            # Set up notification monitoring
-            proc_notify = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "--monitor",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            if self._bus:
+                path = self._device_path(mac)
+                if path is None:
+                    self.logger.error(f"Unknown device {mac}")
+                    return False
 
-            # Remove device if previously paired
-            subprocess.run(
-                ["bluetoothctl", "remove", mac], check=True, capture_output=True
-            )
+                paired = self._device_props(path).get("Paired")
+                if not (paired and paired.value):
+                    try:
+                        await asyncio.wait_for(
+                            bluez.call(self._bus, path, bluez.DEVICE_INTERFACE, "Pair"),
+                            timeout=30.0,
+                        )
+                    except asyncio.TimeoutError:
+                        self.logger.error("Pairing timed out")
+                        # bluetoothd keeps bonding after we stop waiting
+                        try:
+                            await bluez.call(
+                                self._bus, path, bluez.DEVICE_INTERFACE, "CancelPairing"
+                            )
+                        except bluez.DBusError:
+                            pass  # Pairing already finished or failed
+                        return False
+                    self.logger.info(f"Successfully paired with {mac}")
 
-            # Trust device first
-            subprocess.run(
-                ["bluetoothctl", "trust", mac], check=True, capture_output=True
-            )
+                await bluez.set_property(
+                    self._bus, path, bluez.DEVICE_INTERFACE, "Trusted", "b", True
+                )
+                await bluez.call(self._bus, path, bluez.DEVICE_INTERFACE, "Connect")
+                if mac in self.audio_devices:
+                    self.audio_devices[mac]["connected"] = True
+                return True
 
-            # Pair device with timeout
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "pair",
-                mac,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            # Remove device if previously paired
+            await self._btcmd(f"remove {mac}", _BTCTL_RESULT_RE)
 
-            # Monitor for pairing events
-            while True:
-                if proc_notify.stdout:
-                    line = await proc_notify.stdout.readline()
-                    if b"Pairing successful" in line:
-                        self.logger.info(f"Successfully paired with {mac}")
-                        break
-                    elif b"Failed to pair" in line:
-                        self.logger.error(f"Failed to pair with {mac}")
-                        return False
+            # Trust device first
+            await self._btcmd(f"trust {mac}", _BTCTL_RESULT_RE)
 
-            # Wait for pairing with timeout
+            # Pair device; the result arrives once the remote side answers
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    proc.communicate(), timeout=30.0
-                )
-                if proc.returncode != 0:
-                    self.logger.error(f"Pairing failed: {stderr.decode()}")
-                    return False
+                output = await self._btcmd(f"pair {mac}", _BTCTL_RESULT_RE, 30.0)
             except asyncio.TimeoutError:
                 self.logger.error("Pairing timed out")
                 return False
+            if "Pairing successful" not in output:
+                self.logger.error(f"Failed to pair with {mac}")
+                return False
+            self.logger.info(f"Successfully paired with {mac}")
 
             # Connect
-            result = subprocess.run(
-                ["bluetoothctl", "connect", mac],
-                capture_output=True,
-                text=True,
-            )
-
-            if "Connection successful" in result.stdout:
+            output = await self._btcmd(f"connect {mac}", _BTCTL_RESULT_RE, 30.0)
+            if "Connection successful" in output:
                 if mac in self.audio_devices:
                     self.audio_devices[mac]["connected"] = True
                 return True
@@ -307,12 +501,17 @@ class BluetoothInterface:
     async def disconnect_device(self, mac: str) -> bool:
         """Disconnect a Bluetooth device"""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl", "disconnect", mac, stdout=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
+            if self._bus:
+                path = self._device_path(mac)
+                if path is None:
+                    return False
+                await bluez.call(self._bus, path, bluez.DEVICE_INTERFACE, "Disconnect")
+                if mac in self.audio_devices:
+                    self.audio_devices[mac]["connected"] = False
+                return True
 
-            if b"Successful disconnected" in stdout:
+            output = await self._btcmd(f"disconnect {mac}", _BTCTL_RESULT_RE)
+            if "Successful disconnected" in output:
                 if mac in self.audio_devices:
                     self.audio_devices[mac]["connected"] = False
                 return True
@@ -322,20 +521,52 @@ class BluetoothInterface:
             self.logger.error(f"Failed to disconnect device {mac}: {e}")
             return False
 
+    def _graph_monitored(self) -> bool:
+        """Check whether pw-mon is tracking graph changes"""
+        return self._graph_monitor is not None and not self._graph_monitor.done()
+
+    async def _monitor_graph(self):
+        """Invalidate cached active devices whenever PipeWire objects come or go"""
+        try:
+            async for _ in iter_graph_changes():
+                self._graph_version += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Graph monitoring unavailable: {e}")
+
     async def get_active_devices(self) -> List[str]:
         """Get list of connected audio devices"""
+        if self._bus:
+            return list(self._active_set)
+
+        if self._graph_monitored() and self._active_version == self._graph_version:
+            return list(self._active)
+
         try:
-            # Use pw-dump to get active Bluetooth sources
-            proc = await asyncio.create_subprocess_exec(
-                "pw-dump",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            version = self._graph_version
+            devices = await asyncio.wait_for(
+                self._dump_active_devices(), ACTIVE_DEVICES_TIMEOUT
             )
-            stdout, _ = await proc.communicate()
+            self._active = devices
+            self._active_version = version
+            return list(devices)
+
+        except asyncio.TimeoutError:
+            # A wedged PipeWire must not stall status updates
+            self.logger.warning("pw-dump timed out, using last active devices")
+            return list(self._active)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get active devices: {e}")
+            return []
 
-            devices = []
-            nodes = json.loads(stdout.decode())
-            for node in nodes:
+    async def _dump_active_devices(self) -> List[str]:
+        """Use pw-dump to get active Bluetooth sources"""
+        devices = []
+        nodes = iter_pw_dump()
+        try:
+            async for node in nodes:
                 if node.get("type") == "PipeWire:Interface:Node":
                     props = node.get("info", {}).get("props", {})
                     if props.get(
@@ -344,48 +575,153 @@ class BluetoothInterface:
                         # Extract MAC from node name (bluez_source.XX_XX_XX_XX_XX_XX)
                         mac = props["node.name"].split(".")[-1].replace("_", ":")
                         devices.append(mac)
-
-            return devices
-
-        except Exception as e:
-            self.logger.error(f"Failed to get active devices: {e}")
-            return []
+        finally:
+            # Kills pw-dump if we were cancelled part way through
+            await nodes.aclose()
+        return devices
 
     async def monitor_signal_strength(self, mac: str) -> Optional[float]:
         """Get signal strength (RSSI) for a device"""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "bluetoothctl",
-                "info",
-                mac,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-
-            # Parse RSSI from info
-            for line in stdout.decode().split("\n"):
-                if "RSSI:" in line:
-                    rssi = int(line.split(":")[1].strip())
-                    if mac in self.audio_devices:
-                        self.audio_devices[mac]["rssi"] = rssi
-                    return rssi
-            return None
+            if self._bus:
+                path = self._device_path(mac)
+                # BlueZ only exposes RSSI while it has a recent reading
+                rssi = self._device_props(path).get("RSSI") if path else None
+                if rssi is None:
+                    return None
+                rssi = rssi.value
+                if mac in self.audio_devices:
+                    self.audio_devices[mac]["rssi"] = rssi
+                return rssi
+
+            info = await self._get_device_info(mac)
+            match = _RSSI_RE.search(info.get("RSSI", ""))
+            if not match:
+                return None
+            rssi = int(match.group(1))
+            if mac in self.audio_devices:
+                self.audio_devices[mac]["rssi"] = rssi
+            return rssi
 
         except Exception as e:
             self.logger.error(f"Failed to get signal strength for {mac}: {e}")
             return None
 
+    def _on_bus_message(self, msg):
+        """Apply object and property changes reported by BlueZ to the caches"""
+        if msg.interface == bluez.OBJECT_MANAGER_INTERFACE:
+            self._on_objects_changed(msg)
+            return
+        if (
+            msg.interface != bluez.PROPERTIES_INTERFACE
+            or msg.member != "PropertiesChanged"
+            or msg.body[0] != bluez.DEVICE_INTERFACE
+        ):
+            return
+
+        _, changed, invalidated = msg.body
+        props = self._managed.get(msg.path, {}).get(bluez.DEVICE_INTERFACE)
+        if props is not None:
+            props.update(changed)
+            for name in invalidated:
+                props.pop(name, None)
+
+        mac = bluez.path_to_mac(msg.path)
+        device = self.audio_devices.get(mac)
+        if device is None:
+            return
+
+        if "RSSI" in invalidated:
+            device.pop("rssi", None)
+        if "Connected" in changed:
+            device["connected"] = changed["Connected"].value
+            state = "connected" if device["connected"] else "disconnected"
+            self.logger.info(f"Device {mac} {state}")
+        if "RSSI" in changed:
+            device["rssi"] = changed["RSSI"].value
+        self._notify_change()
+
+    def _on_objects_changed(self, msg):
+        """Track BlueZ objects being added and removed"""
+        if msg.member == "InterfacesAdded":
+            path, interfaces = msg.body
+            self._managed.setdefault(path, {}).update(interfaces)
+            props = interfaces.get(bluez.DEVICE_INTERFACE)
+            if props and bluez.is_audio_device(props):
+                device = bluez.device_summary(props)
+                self.audio_devices[device["mac"]] = device
+        elif msg.member == "InterfacesRemoved":
+            path, names = msg.body
+            interfaces = self._managed.get(path, {})
+            for name in names:
+                interfaces.pop(name, None)
+            if not interfaces:
+                self._managed.pop(path, None)
+            if bluez.DEVICE_INTERFACE in names:
+                self.audio_devices.pop(bluez.path_to_mac(path), None)
+        else:
+            return
+        self._notify_change()
+
+    def _notify_change(self):
+        """Wake the signal monitor and any on_change listener"""
+        self._refresh_device_state()
+        self._changed.set()
+        if self.on_change:
+            self.on_change()
+
+    def _refresh_device_state(self):
+        """Recompute the cached active devices and signal quality"""
+        self._active_set = {
+            mac for mac, device in self.audio_devices.items() if device.get("connected")
+        }
+        self._signal_quality = self._compute_signal_quality()
+
+    def _compute_signal_quality(self) -> Dict[str, Dict]:
+        """Rate the signal of each connected audio device"""
+        return {
+            mac: {"rssi": device.get("rssi"), "quality": _rate_rssi(device.get("rssi"))}
+            for mac, device in self.audio_devices.items()
+            if device.get("connected")
+        }
+
+    def _check_signal(self):
+        """Log when a connected device's signal becomes weak or recovers"""
+        weak = {
+            mac
+            for mac, device in self.audio_devices.items()
+            if device.get("connected")
+            and device.get("rssi") is not None
+            and device["rssi"] < WEAK_RSSI
+        }
+        for mac in weak - self._weak:
+            rssi = self.audio_devices[mac]["rssi"]
+            self.logger.warning(f"Weak Bluetooth signal for {mac}: {rssi} dBm")
+        for mac in self._weak - weak:
+            self.logger.info(f"Bluetooth signal for {mac} recovered")
+        self._weak = weak
+
     async def start_signal_monitoring(self):
         """Start monitoring signal strength of connected devices"""
+        if self._bus:
+            # BlueZ pushes changes, so there is nothing to poll
+            try:
+                while True:
+                    await self._changed.wait()
+                    self._changed.clear()
+                    self._check_signal()
+            except asyncio.CancelledError:
+                pass
+            return
+
         while True:
             try:
                 active = await self.get_active_devices()
-                for mac in active:
-                    rssi = await self.monitor_signal_strength(mac)
-                    if (
-                        rssi is not None and rssi < -80
-                    ):  # Typical threshold for poor connection
+                rssis = await asyncio.gather(
+                    *(self.monitor_signal_strength(mac) for mac in active)
+                )
+                for mac, rssi in zip(active, rssis):
+                    if rssi is not None and rssi < WEAK_RSSI:
                         self.logger.warning(
                             f"Weak Bluetooth signal for {mac}: {rssi} dBm"
                         )
@@ -400,15 +736,16 @@ class BluetoothInterface:
 
     async def get_status(self) -> Dict:
         """Get current Bluetooth status"""
+        if self._bus:
+            # Kept current by BlueZ signals, so there is nothing to query
+            active = list(self._active_set)
+            signal_quality = dict(self._signal_quality)
+        else:
+            active = await self.get_active_devices()
+            signal_quality = self._compute_signal_quality()
+
         return {
             "devices": self.audio_devices,
-            "active": await self.get_active_devices(),
-            "signal_quality": {
-                mac: {
-                    "rssi": device.get("rssi"),
-                    "quality": "good" if device.get("rssi", -100) > -80 else "poor",
-                }
-                for mac, device in self.audio_devices.items()
-                if device.get("connected")
-            },
+            "active": active,
+            "signal_quality": signal_quality,
         }
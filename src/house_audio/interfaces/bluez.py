@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+import logging
+from typing import Dict, List, Optional
+
+from dbus_fast import BusType, Message, MessageType, Variant
+from dbus_fast.aio import MessageBus
+from dbus_fast.errors import DBusError
+from dbus_fast.service import ServiceInterface, method
+
+BLUEZ = "org.bluez"
+ADAPTER_INTERFACE = "org.bluez.Adapter1"
+DEVICE_INTERFACE = "org.bluez.Device1"
+AGENT_INTERFACE = "org.bluez.Agent1"
+AGENT_MANAGER_INTERFACE = "org.bluez.AgentManager1"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+DBUS = "org.freedesktop.DBus"
+
+# Object path our pairing agent is exported on
+AGENT_PATH = "/house_audio/agent"
+
+# Class of Device major service class bit for audio devices
+AUDIO_SERVICE_CLASS = 0x200000
+
+# Signals sent when device properties such as RSSI or Connected change
+DEVICE_CHANGES_RULE = (
+    "type='signal',sender='org.bluez',"
+    "interface='org.freedesktop.DBus.Properties',member='PropertiesChanged',"
+    "arg0='org.bluez.Device1'"
+)
+# Signals sent when BlueZ objects (adapters, devices) appear or go away
+OBJECT_CHANGES_RULE = (
+    "type='signal',sender='org.bluez',interface='org.freedesktop.DBus.ObjectManager'"
+)
+
+ManagedObjects = Dict[str, Dict[str, Dict[str, Variant]]]
+
+
+class PairingAgent(ServiceInterface):
+    """BlueZ pairing agent that accepts incoming audio devices"""
+
+    def __init__(self):
+        super().__init__(AGENT_INTERFACE)
+        self.logger = logging.getLogger(__name__)
+
+    @method()
+    def Release(self):
+        self.logger.info("Pairing agent released")
+
+    @method()
+    def RequestPinCode(self, device: "o") -> "s":
+        return "0000"
+
+    @method()
+    def DisplayPinCode(self, device: "o", pincode: "s"):
+        self.logger.info(f"PIN code for {device}: {pincode}")
+
+    @method()
+    def RequestPasskey(self, device: "o") -> "u":
+        return 0
+
+    @method()
+    def DisplayPasskey(self, device: "o", passkey: "u", entered: "q"):
+        self.logger.info(f"Passkey for {device}: {passkey:06d}")
+
+    @method()
+    def RequestConfirmation(self, device: "o", passkey: "u"):
+        self.logger.info(f"Confirming passkey {passkey:06d} for {device}")
+
+    @method()
+    def RequestAuthorization(self, device: "o"):
+        self.logger.info(f"Authorizing {device}")
+
+    @method()
+    def AuthorizeService(self, device: "o", uuid: "s"):
+        pass
+
+    @method()
+    def Cancel(self):
+        self.logger.info("Pairing cancelled")
+
+
+async def connect() -> MessageBus:
+    """Connect to the system bus"""
+    return await MessageBus(bus_type=BusType.SYSTEM).connect()
+
+
+async def call(
+    bus: MessageBus,
+    path: str,
+    interface: str,
+    member: str,
+    signature: str = "",
+    body: Optional[List] = None,
+    destination: str = BLUEZ,
+) -> List:
+    """Call a BlueZ method and return the reply body"""
+    reply = await bus.call(
+        Message(
+            destination=destination,
+            path=path,
+            interface=interface,
+            member=member,
+            signature=signature,
+            body=body or [],
+        )
+    )
+    if reply.message_type == MessageType.ERROR:
+        raise DBusError(reply.error_name, reply.body[0] if reply.body else "")
+    return reply.body
+
+
+async def get_managed_objects(bus: MessageBus) -> ManagedObjects:
+    """Get every BlueZ object with its interfaces and properties"""
+    body = await call(bus, "/", OBJECT_MANAGER_INTERFACE, "GetManagedObjects")
+    return body[0]
+
+
+async def set_property(
+    bus: MessageBus, path: str, interface: str, name: str, signature: str, value
+):
+    """Write a single property"""
+    await call(
+        bus,
+        path,
+        PROPERTIES_INTERFACE,
+        "Set",
+        "ssv",
+        [interface, name, Variant(signature, value)],
+    )
+
+
+async def add_match(bus: MessageBus, rule: str):
+    """Ask the bus daemon to route matching signals to us"""
+    await call(bus, "/org/freedesktop/DBus", DBUS, "AddMatch", "s", [rule], DBUS)
+
+
+def path_to_mac(path: str) -> str:
+    """Get the device address from its object path"""
+    return path.rsplit("/dev_", 1)[-1].replace("_", ":")
+
+
+def find_adapter(objects: ManagedObjects) -> Optional[str]:
+    """Get the object path of the first Bluetooth adapter"""
+    for path, interfaces in objects.items():
+        if ADAPTER_INTERFACE in interfaces:
+            return path
+    return None
+
+
+def device_path(adapter: str, mac: str) -> str:
+    """Get the object path BlueZ gives a device on an adapter"""
+    return f"{adapter}/dev_{mac.upper().replace(':', '_')}"
+
+
+def is_audio_device(props: Dict[str, Variant]) -> bool:
+    """Check Device1 properties for the audio service class"""
+    return "Class" in props and bool(props["Class"].value & AUDIO_SERVICE_CLASS)
+
+
+def device_summary(props: Dict[str, Variant]) -> Dict:
+    """Convert Device1 properties to the device dict used by the interface"""
+    info = {
+        "name": props["Alias"].value if "Alias" in props else props["Address"].value,
+        "mac": props["Address"].value,
+        "connected": props["Connected"].value,
+        "trusted": props["Trusted"].value,
+        "paired": props["Paired"].value,
+    }
+    if "RSSI" in props:
+        info["rssi"] = props["RSSI"].value
+    return info
+
+
+async def register_agent(bus: MessageBus, agent: PairingAgent):
+    """Export the pairing agent and make it the default"""
+    bus.export(AGENT_PATH, agent)
+    try:
+        await call(
+            bus,
+            "/org/bluez",
+            AGENT_MANAGER_INTERFACE,
+            "RegisterAgent",
+            "os",
+            [AGENT_PATH, "DisplayOnly"],
+        )
+    except DBusError:
+        # Some adapters don't support DisplayOnly
+        await call(
+            bus,
+            "/org/bluez",
+            AGENT_MANAGER_INTERFACE,
+            "RegisterAgent",
+            "os",
+            [AGENT_PATH, "NoInputNoOutput"],
+        )
+    await call(
+        bus,
+        "/org/bluez",
+        AGENT_MANAGER_INTERFACE,
+        "RequestDefaultAgent",
+        "o",
+        [AGENT_PATH],
+    )
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import asyncio
+import codecs
+import json
+import re
+from typing import AsyncIterator, Dict
+
+# pw-dump output is read in chunks of this size
+READ_CHUNK = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+async def iter_json_array(stream: asyncio.StreamReader) -> AsyncIterator[Dict]:
+    """Yield elements of a JSON array as they arrive on a stream
+
+    Only the element currently being decoded is held in memory, so large
+    arrays can be filtered without materializing the whole document.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+
+        if pos < len(buf):
+            char = buf[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError(f"Expected JSON array, got {char!r}")
+                started = True
+                pos += 1
+                continue
+            if char == "]":
+                return
+            if char == ",":
+                pos += 1
+                continue
+
+            try:
+                item, pos = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield item
+                continue
+
+        if eof:
+            if started:
+                raise ValueError("Unterminated JSON array")
+            return
+
+        # Need more input: drop consumed text and read the next chunk
+        chunk = await stream.read(READ_CHUNK)
+        eof = not chunk
+        buf = buf[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+
+
+async def iter_pw_dump(*args: str) -> AsyncIterator[Dict]:
+    """Stream objects from pw-dump without buffering its whole output"""
+    proc = await asyncio.create_subprocess_exec(
+        "pw-dump",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    completed = False
+    try:
+        async for obj in iter_json_array(proc.stdout):
+            yield obj
+        completed = True
+    finally:
+        if not completed and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"pw-dump failed with exit code {proc.returncode}")
+
+
+async def iter_graph_changes() -> AsyncIterator[bytes]:
+    """Yield pw-mon lines announcing objects added to or removed from the graph"""
+    proc = await asyncio.create_subprocess_exec(
+        "pw-mon",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        async for line in proc.stdout:
+            if line.startswith((b"added:", b"removed:")):
+                yield line
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import asyncio
+import functools
+import subprocess
+from typing import Dict, List
+
+try:
+    from dbus_fast import BusType, Message, MessageType
+    from dbus_fast.aio import MessageBus
+    from dbus_fast.errors import DBusError
+except ImportError:  # dbus-fast not installed, fall back to systemctl
+    MessageBus = None
+
+SYSTEMD = "org.freedesktop.systemd1"
+SYSTEMD_PATH = "/org/freedesktop/systemd1"
+MANAGER_INTERFACE = "org.freedesktop.systemd1.Manager"
+UNIT_INTERFACE = "org.freedesktop.systemd1.Unit"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+
+
+async def unit_states(units: List[str], user: bool = False) -> Dict[str, str]:
+    """Get the active state of systemd units, e.g. {"pipewire": "active"}"""
+    if MessageBus is not None:
+        try:
+            return await _bus_unit_states(units, user)
+        except Exception:
+            pass  # No usable bus, ask systemctl instead
+    return await _systemctl_unit_states(units, user)
+
+
+async def _bus_unit_states(units: List[str], user: bool) -> Dict[str, str]:
+    """Read each unit's ActiveState from systemd over one connection"""
+    bus_type = BusType.SESSION if user else BusType.SYSTEM
+    bus = await MessageBus(bus_type=bus_type).connect()
+    try:
+        states = await asyncio.gather(*(_active_state(bus, unit) for unit in units))
+    finally:
+        bus.disconnect()
+    return dict(zip(units, states))
+
+
+async def _call(bus, path: str, interface: str, member: str, signature: str, body):
+    """Call a systemd method and return the reply body"""
+    reply = await bus.call(
+        Message(
+            destination=SYSTEMD,
+            path=path,
+            interface=interface,
+            member=member,
+            signature=signature,
+            body=body,
+        )
+    )
+    if reply.message_type == MessageType.ERROR:
+        raise DBusError(reply.error_name, reply.body[0] if reply.body else "")
+    return reply.body
+
+
+async def _active_state(bus, unit: str) -> str:
+    """Get the ActiveState of a single unit"""
+    name = unit if "." in unit else f"{unit}.service"
+    try:
+        (path,) = await _call(
+            bus, SYSTEMD_PATH, MANAGER_INTERFACE, "GetUnit", "s", [name]
+        )
+    except DBusError as e:
+        # Units that aren't loaded are inactive, as systemctl reports them
+        if e.type == "org.freedesktop.systemd1.NoSuchUnit":
+            return "inactive"
+        raise
+
+    (state,) = await _call(
+        bus, path, PROPERTIES_INTERFACE, "Get", "ss", [UNIT_INTERFACE, "ActiveState"]
+    )
+    return state.value
+
+
+async def _systemctl_unit_states(units: List[str], user: bool) -> Dict[str, str]:
+    """Get unit states with a single systemctl call
+
+    Spawned from a worker thread so fork and exec don't stall the event loop.
+    """
+    scope = ["--user"] if user else []
+    cmd = ["systemctl", *scope, "is-active", *units]
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        None, functools.partial(subprocess.run, cmd, capture_output=True)
+    )
+
+    # One state per unit, in the order given
+    return dict(zip(units, result.stdout.decode().split()))
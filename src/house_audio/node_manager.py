@@ -3,9 +3,11 @@
 import asyncio
 import logging
 from typing import Dict, Optional
-from .interfaces.pipewire import PipewireInterface
+from .interfaces.audio import AudioInterface
 from .interfaces.bluetooth import BluetoothInterface
-from .sync import PTPSync  # New precise timing sync
+
+# Seconds between state refreshes when nothing has changed
+STATE_INTERVAL = 5
 
 
 class NodeManager:
@@ -14,12 +16,15 @@ class NodeManager:
     def __init__(self, mode: str = "standalone"):
         self.logger = logging.getLogger("node_manager")
         self.mode = mode
-        self.audio = PipewireInterface(mode=mode)
+        self.audio = AudioInterface(mode=mode)
         self.bluetooth = BluetoothInterface()
         self.sync = None  # Only initialize in distributed mode
         self.active_routes = {}
         self.node_status = {}
         self._running = False
+        self.tasks = []  # Background monitors started by setup()
+        self._poor_signal = set()  # Devices last seen with a poor signal
+        self._state_changed = asyncio.Event()  # Set to refresh node_status early
         self.default_output = "default"  # Assuming a default output device
 
     async def setup(self):
@@ -27,19 +32,18 @@ class NodeManager:
         # Core setup
         await self.audio.setup()
         await self.bluetooth.setup()
+        self.bluetooth.on_change = self._request_update
 
         if self.mode == "distributed":
-            # Initialize sync for distributed mode
+            # Initialize sync for distributed mode, only imported when needed
+            from .sync import PTPSync  # New precise timing sync
+
             self.sync = PTPSync()
             await self.sync.setup()
-            self.tasks = [
-                asyncio.create_task(self._monitor_sync()),
-                asyncio.create_task(self._monitor_bluetooth()),
-                asyncio.create_task(self._monitor_network()),
-            ]
+            self.tasks = [asyncio.create_task(self._monitor_sync())]
         else:
-            # Standalone mode only needs bluetooth monitoring
-            self.tasks = [asyncio.create_task(self._monitor_bluetooth())]
+            # Bluetooth and network are checked on each state update
+            self.tasks = []
 
     async def start(self):
         """Start the node manager"""
@@ -49,13 +53,15 @@ class NodeManager:
             # Initialize interfaces
             await self.setup()
 
-            # Initial state
-            await self._update_state()
-
-            # Start state monitoring
+            # Single writer of node_status: refresh every STATE_INTERVAL
+            # seconds, or sooner when a change is reported
             while self._running:
+                self._state_changed.clear()
                 await self._update_state()
-                await asyncio.sleep(5)
+                try:
+                    await asyncio.wait_for(self._state_changed.wait(), STATE_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
 
         except Exception as e:
             self.logger.error(f"Node manager failed: {e}")
@@ -66,33 +72,37 @@ class NodeManager:
     async def stop(self):
         """Stop the node manager"""
         self._running = False
-        try:
-            for task in self.tasks:
-                task.cancel()
-            await self.audio.cleanup()
-            await self.bluetooth.cleanup()
-            await self.sync.cleanup()
-        except Exception as e:
-            self.logger.error(f"Cleanup failed: {e}")
+        await self.cleanup()
 
     async def _update_state(self):
         """Update current state"""
         try:
-            audio_status = await self.audio.get_status()
-            bluetooth_status = await self.bluetooth.get_status()
-            sync_status = await self.sync.get_status() if self.sync else None
-            network_status = await self._get_network_stats()
+            # Query all subsystems at once
+            audio, bluetooth, sync, network = await asyncio.gather(
+                self.audio.get_status(),
+                self.bluetooth.get_status(),
+                self.sync.get_status() if self.sync else asyncio.sleep(0),
+                self._get_network_stats(),
+            )
 
             self.node_status = {
-                "audio": audio_status,
-                "bluetooth": bluetooth_status,
-                "sync": sync_status,
-                "network": network_status,
+                "audio": audio,
+                "bluetooth": bluetooth,
+                "sync": sync,
+                "network": network,
                 "status": "running" if self._running else "stopped",
             }
 
         except Exception as e:
             self.logger.error(f"State update failed: {e}")
+            return
+
+        await self._check_bluetooth(bluetooth)
+        await self._check_network(network)
+
+    def _request_update(self):
+        """Ask the state loop to refresh node_status now"""
+        self._state_changed.set()
 
     async def get_state(self) -> Dict:
         """Get current node state"""
@@ -101,20 +111,20 @@ class NodeManager:
     async def set_volume(self, device_id: str, volume: float) -> None:
         """Set volume for a device"""
         await self.audio.set_volume(device_id, volume)
-        await self._update_state()
+        self._request_update()
 
     async def connect_bluetooth(self, mac: str) -> bool:
         """Connect to a Bluetooth device"""
         success = await self.bluetooth.connect_device(mac)
         if success:
-            await self._update_state()
+            self._request_update()
         return success
 
     async def disconnect_bluetooth(self, mac: str) -> bool:
         """Disconnect a Bluetooth device"""
         success = await self.bluetooth.disconnect_device(mac)
         if success:
-            await self._update_state()
+            self._request_update()
         return success
 
     async def handle_bluetooth_device(self, mac: str, action: str) -> bool:
@@ -138,43 +148,40 @@ class NodeManager:
 
     async def _monitor_sync(self):
         """Monitor and maintain clock sync"""
+        if self.sync is None:
+            return
         while True:
             try:
-                drift = await self.sync.check_drift() if self.sync else None
-                if abs(drift) > 0.1:  # More than 0.1ms drift
-                    await self.sync.realign() if self.sync else None
+                drift = await self.sync.check_drift()
+                # More than 0.1ms drift, and more than the sync noise
+                if abs(drift) > max(0.1, 3 * self.sync.jitter):
+                    await self.sync.realign()
             except Exception as e:
                 self.logger.error(f"Sync error: {e}")
             await asyncio.sleep(1)
 
-    async def _monitor_bluetooth(self):
-        """Monitor Bluetooth connections"""
-        while True:
-            try:
-                status = await self.bluetooth.get_status()
-                for mac, device in status["devices"].items():
-                    if mac in status["signal_quality"]:
-                        quality = status["signal_quality"][mac]
-                        if quality["quality"] < 30:  # Poor signal
-                            if self.mode == "distributed":
-                                await self._handle_poor_signal(mac, quality)
-                            else:
-                                self.logger.warning(f"Poor Bluetooth signal for {mac}")
-            except Exception as e:
-                self.logger.error(f"Bluetooth monitoring error: {e}")
-            await asyncio.sleep(1)
+    async def _check_bluetooth(self, status: Dict):
+        """React to connected Bluetooth devices whose signal turns poor"""
+        try:
+            qualities = status["signal_quality"]
+            poor = {mac for mac, q in qualities.items() if q["quality"] == "poor"}
+            # Only act on the transition, not on every state update
+            for mac in poor - self._poor_signal:
+                if self.mode == "distributed":
+                    await self._handle_poor_signal(mac, qualities[mac])
+                else:
+                    self.logger.warning(f"Poor Bluetooth signal for {mac}")
+            self._poor_signal = poor
+        except Exception as e:
+            self.logger.error(f"Bluetooth monitoring error: {e}")
 
-    async def _monitor_network(self):
-        """Monitor network conditions"""
-        while True:
-            try:
-                # Check network latency and jitter
-                stats = await self._get_network_stats()
-                if stats["jitter"] > 5:  # More than 5ms jitter
-                    await self._adjust_buffer_size(stats)
-            except Exception as e:
-                self.logger.error(f"Network monitoring error: {e}")
-            await asyncio.sleep(5)
+    async def _check_network(self, stats: Optional[Dict]):
+        """React to network latency and jitter"""
+        try:
+            if stats and stats["jitter"] > 5:  # More than 5ms jitter
+                await self._adjust_buffer_size(stats)
+        except Exception as e:
+            self.logger.error(f"Network monitoring error: {e}")
 
     async def _handle_poor_signal(self, mac: str, quality: dict):
         """Handle poor Bluetooth signal (future distributed mode)"""
@@ -192,22 +199,34 @@ class NodeManager:
             await self._rollback_handoff(mac)
 
     async def get_status(self) -> Dict:
-        """Get current node status"""
-        return {
-            "audio": await self.audio.get_status(),
-            "bluetooth": await self.bluetooth.get_status(),
-            "sync": await self.sync.get_status() if self.sync else None,
-            "network": await self._get_network_stats(),
-            "active_routes": self.active_routes,
-        }
+        """Get current node status, as of the last state update"""
+        return {**self.node_status, "active_routes": self.active_routes}
 
     async def cleanup(self):
         """Clean up resources"""
-        for task in self.tasks:
-            task.cancel()
-        await self.audio.cleanup()
-        await self.bluetooth.cleanup()
-        await self.sync.cleanup() if self.sync else None
+        await asyncio.gather(*(self._cancel(task) for task in self.tasks))
+
+        # Subsystems shut down independently, so don't let one hold up or
+        # abort the others
+        results = await asyncio.gather(
+            self.audio.cleanup(),
+            self.bluetooth.cleanup(),
+            self.sync.cleanup() if self.sync else asyncio.sleep(0),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Cleanup failed: {result}")
+
+    async def _cancel(self, task: asyncio.Task):
+        """Cancel a background task and wait for it to finish"""
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Task failed: {e}")
 
     # Helper methods
     async def _get_network_stats(self):
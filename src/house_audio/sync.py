@@ -3,11 +3,41 @@
 import asyncio
 import logging
 import socket
+import statistics
 import struct
 import time
-from typing import Dict, Optional
+from typing import Dict
 import uuid
 
+PTP_EVENT_PORT = 319
+# Sync requests sent per synchronization
+SYNC_SAMPLES = 8
+# How long (seconds) to wait for sync responses before using what arrived
+SYNC_TIMEOUT = 1.0
+# Datagrams buffered before the oldest are dropped
+RX_QUEUE_SIZE = 64
+
+SYNC_REQ = b"sync_req"
+SYNC_RESP = b"sync_resp"
+# Wire formats: node ID for election, and (sequence, t2, t3) after SYNC_RESP.
+# Requests are SYNC_REQ followed by the one byte sequence number.
+_ID_STRUCT = struct.Struct("!Q")
+_SYNC_STRUCT = struct.Struct("!Bdd")
+_SYNC_RESP_SIZE = len(SYNC_RESP) + _SYNC_STRUCT.size
+
+
+class _PTPProtocol(asyncio.DatagramProtocol):
+    """Queue incoming PTP datagrams for PTPSync"""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr):
+        # Nothing may be reading (e.g. on the master), so keep only the newest
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(data)
+
 
 class PTPSync:
     """Precision Time Protocol synchronization"""
@@ -15,16 +45,29 @@ class PTPSync:
     def __init__(self):
         self.logger = logging.getLogger("ptp_sync")
         self.socket = None
+        self.transport = None
+        self._rx = None  # Queue of received datagrams
         self.master = False
         self.offset = 0.0  # Time offset from master
+        self.jitter = 0.0  # Spread of the offset samples
         self.drift_rate = 0.0
         self.last_sync = 0
+        # Use MAC address for unique ID, looked up once as it may read sysfs
+        self._node_id = uuid.getnode()
 
     async def setup(self):
         """Initialize PTP sync"""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.socket.bind(("", 319))  # PTP event port
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self.socket.bind(("", PTP_EVENT_PORT))
+
+        # Receive through the event loop instead of blocking recvfrom calls
+        self._rx = asyncio.Queue(maxsize=RX_QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _PTPProtocol(self._rx), sock=self.socket
+        )
 
         # Determine if we're master
         self.master = await self._elect_master()
@@ -40,50 +83,73 @@ class PTPSync:
         our_id = self._get_node_id()
 
         # Broadcast our ID
-        msg = struct.pack("!Q", our_id)
-        self.socket.sendto(msg, ("<broadcast>", 319))
+        self.transport.sendto(_ID_STRUCT.pack(our_id), ("<broadcast>", PTP_EVENT_PORT))
 
         # Collect other IDs for 1 second
-        start = time.time()
         other_ids = set()
-
-        while time.time() - start < 1:
-            try:
-                data, addr = self.socket.recvfrom(8)
-                other_id = struct.unpack("!Q", data)[0]
-                other_ids.add(other_id)
-            except socket.timeout:
-                break
+        try:
+            await asyncio.wait_for(self._collect_ids(our_id, other_ids), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
 
         # We're master if we have the lowest ID
-        return our_id < min(other_ids) if other_ids else True
+        return min(other_ids | {our_id}) == our_id
+
+    async def _collect_ids(self, our_id: int, ids: set):
+        """Add node IDs broadcast by other nodes to ids until cancelled"""
+        while True:
+            data = await self._rx.get()
+            if len(data) == _ID_STRUCT.size:
+                (node_id,) = _ID_STRUCT.unpack(data)
+                # Our own broadcast is looped back to us
+                if node_id != our_id:
+                    ids.add(node_id)
 
     async def _initial_sync(self):
         """Perform initial synchronization"""
         # Implement IEEE 1588 PTP sync
         # For now, use simplified sync
-        offset_sum = 0
-        samples = 0
-
-        for _ in range(8):  # Take 8 samples
-            t1 = time.time()
-            # Send sync request
-            self.socket.sendto(b"sync_req", ("<broadcast>", 319))
 
-            # Wait for response
-            data, addr = self.socket.recvfrom(1024)
+        # Drop replies left over from an earlier round
+        while not self._rx.empty():
+            self._rx.get_nowait()
+
+        # Samples are independent, so send every request at once and match
+        # responses by sequence number as they arrive
+        sent = {}  # sequence -> t1
+        for seq in range(SYNC_SAMPLES):
+            sent[seq] = time.time()
+            self.transport.sendto(
+                SYNC_REQ + bytes([seq]), ("<broadcast>", PTP_EVENT_PORT)
+            )
+
+        offsets = []
+        try:
+            await asyncio.wait_for(self._collect_offsets(sent, offsets), SYNC_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+        if offsets:
+            # Network asymmetry skews samples, so drop the extremes and take
+            # the median rather than averaging
+            offsets.sort()
+            if len(offsets) > 2:
+                offsets = offsets[1:-1]
+            self.offset = statistics.median(offsets)
+            self.jitter = statistics.pstdev(offsets)
+
+    async def _collect_offsets(self, sent: Dict[int, float], offsets: list):
+        """Add an offset to offsets for each answered request in sent"""
+        while sent:
+            data = await self._rx.get()
             t4 = time.time()
-
-            if data.startswith(b"sync_resp"):
-                t2, t3 = struct.unpack("!dd", data[9:])
-                offset = ((t2 - t1) + (t3 - t4)) / 2
-                offset_sum += offset
-                samples += 1
-
-            await asyncio.sleep(0.1)
-
-        if samples > 0:
-            self.offset = offset_sum / samples
+            # Skip other traffic such as our own requests
+            if len(data) != _SYNC_RESP_SIZE or not data.startswith(SYNC_RESP):
+                continue
+            seq, t2, t3 = _SYNC_STRUCT.unpack_from(data, len(SYNC_RESP))
+            t1 = sent.pop(seq, None)
+            if t1 is not None:
+                offsets.append(((t2 - t1) + (t3 - t4)) / 2)
 
     async def check_drift(self) -> float:
         """Check clock drift from master"""
@@ -115,16 +181,17 @@ class PTPSync:
             "is_master": self.master,
             "offset": self.offset,
             "drift_rate": self.drift_rate,
+            "jitter": self.jitter,
             "last_sync": self.last_sync,
         }
 
     async def cleanup(self):
         """Clean up resources"""
-        if self.socket:
+        if self.transport:
+            self.transport.close()
+        elif self.socket:
             self.socket.close()
 
     def _get_node_id(self) -> int:
         """Get unique node ID"""
-        # Use MAC address for unique ID
-        mac = uuid.getnode()
-        return mac
+        return self._node_id
@@ -2,11 +2,25 @@
 
 import asyncio
 import logging
-import subprocess
-from typing import Dict, Optional
+import os
+import sys
+import threading
+from typing import Dict, List, Optional
 from ..interfaces.audio import AudioInterface
 from ..interfaces.bluetooth import BluetoothInterface
 
+HELP = """
+Commands:
+d: Show available audio devices
+b: Show connected Bluetooth devices
+r <mac> <device>: Route Bluetooth to device
+a <mac> <device>: Add another output to existing route
+v <device> <0-100>: Set device volume
+t <device>: Test audio output
+T: Test all audio outputs
+h: Show this help
+q: Quit"""
+
 
 class AudioTester:
     def __init__(self, mode: str = "standalone"):
@@ -17,6 +31,20 @@ class AudioTester:
         self.connected_devices = {}
         self.device_routes = {}
         self.outputs = {}
+        self._volume_cache = {}  # output -> last known volume (0-1)
+        self._output_display = {}  # output -> "name (description)" for reports
+        self._lines = None  # Queue of stdin lines, None at end of input
+        # Interactive commands: name -> (handler, number of arguments)
+        self._commands = {
+            "d": (self.show_outputs, 0),
+            "b": (self.show_devices, 0),
+            "r": (self.route_audio, 2),
+            "a": (lambda mac, out: self.route_audio(mac, out, add_to_existing=True), 2),
+            "v": (lambda out, vol: self.set_output_volume(out, float(vol)), 2),
+            "t": (self.test_output, 1),
+            "T": (self.test_all, 0),
+            "h": (self.show_help, 0),
+        }
 
     async def setup(self):
         """Initialize interfaces"""
@@ -24,10 +52,10 @@ class AudioTester:
         await self.bluetooth.setup()
 
         # Show available audio outputs
-        self.outputs = await self.audio.discover_devices()
+        await self._load_outputs()
         self.logger.info("Available audio outputs:")
         for name, info in self.outputs.items():
-            self.logger.info(f"  {name}: {info}")
+            self.logger.info("  %s: %s", name, info)
 
         # Make discoverable
         await self.bluetooth.set_discoverable(True)
@@ -36,32 +64,68 @@ class AudioTester:
     async def show_devices(self):
         """Show connected Bluetooth devices and their status"""
         status = await self.bluetooth.get_status()
-        print("\nConnected devices:")
+
+        # Build the whole report first so it is written in one go
+        lines = ["\nConnected devices:"]
         for mac in status["active"]:
             device = status["devices"].get(mac, {})
             route = self.device_routes.get(mac, "not routed")
-            print(f"- {device.get('name', mac)} ({mac})")
-            print(f"  → Routed to: {route}")
+            lines.append(f"- {device.get('name', mac)} ({mac})")
+            lines.append(f"  → Routed to: {route}")
             if mac in status["signal_quality"]:
-                print(f"  → Signal: {status['signal_quality'][mac]['quality']}")
-            if mac in self.device_routes:
-                vol = await self.audio.get_volume(self.device_routes[mac])
-                print(f"  → Volume: {int(vol * 100)}%")
+                lines.append(f"  → Signal: {status['signal_quality'][mac]['quality']}")
+            vol = self._volume_cache.get(self.device_routes.get(mac))
+            if vol is not None:
+                lines.append(f"  → Volume: {int(vol * 100)}%")
+        print("\n".join(lines))
 
     async def show_outputs(self):
         """Show available audio outputs"""
-        print("\nAvailable outputs:")
-        for name, info in self.outputs.items():
-            vol = await self.audio.get_volume(name)
-            print(f"- {name} ({info['name']})")
+        # Outputs may have come or gone; discovery is cached until they do
+        await self._load_outputs()
+
+        lines = ["\nAvailable outputs:"]
+        for name, display in self._output_display.items():
+            vol = self._volume_cache.get(name)
+            lines.append(f"- {display}")
             if vol is not None:
-                print(f"  → Volume: {int(vol * 100)}%")
+                lines.append(f"  → Volume: {int(vol * 100)}%")
             else:
-                print("  → Volume: Not available")
+                lines.append("  → Volume: Not available")
+        print("\n".join(lines))
+
+    async def _load_outputs(self):
+        """Discover outputs and cache their labels and volumes"""
+        self.outputs = await self.audio.discover_devices()
+        self._output_display = {
+            name: f"{name} ({info.get('name') or name})"
+            for name, info in self.outputs.items()
+        }
+
+        # Forget outputs that went away and read volumes only for new ones
+        self._volume_cache = {
+            name: vol
+            for name, vol in self._volume_cache.items()
+            if name in self.outputs
+        }
+        await self._refresh_volumes(
+            [name for name in self.outputs if name not in self._volume_cache]
+        )
+
+    async def _refresh_volumes(self, names: List[str]):
+        """Read the volumes of outputs at once into the cache"""
+        volumes = await asyncio.gather(
+            *(self.audio.get_volume(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, vol in zip(names, volumes):
+            if vol is not None and not isinstance(vol, Exception):
+                self._volume_cache[name] = vol
 
     async def route_audio(self, mac: str, output: str, add_to_existing: bool = False):
         """Route audio from device to specific output"""
-        if mac not in self.connected_devices:
+        device = self.connected_devices.get(mac)
+        if device is None:
             raise ValueError(f"Device {mac} not connected")
         if output not in self.outputs:
             raise ValueError(f"Output {output} not available")
@@ -74,8 +138,8 @@ class AudioTester:
             route_id = await self.audio.create_route(mac, output)
             self.device_routes[mac] = output
 
-        name = self.connected_devices[mac].get("name", mac)
-        self.logger.info(f"Routing {name} → {output}")
+        name = device.get("name", mac)
+        self.logger.info("Routing %s → %s", name, output)
 
         # Set initial volume
         await self.set_output_volume(output, 50)
@@ -88,20 +152,47 @@ class AudioTester:
             raise ValueError("Volume must be between 0 and 100")
 
         await self.audio.set_volume(output, volume / 100)
-        self.logger.info(f"Set {output} volume to {volume}%")
+        self._volume_cache[output] = volume / 100
+        self.logger.info("Set %s volume to %s%%", output, volume)
 
     async def test_output(self, output: str, duration: int = 1):
         """Test an output with a short tone"""
-        self.logger.info(f"Testing output {output}...")
+        self.logger.info("Testing output %s...", output)
+        cmd = ["speaker-test", "-D", output, "-t", "sine", "-f", "440", "-l", "1"]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
         try:
-            subprocess.run(
-                ["speaker-test", "-D", output, "-t", "sine", "-f", "440", "-l", "1"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=duration,
-            )
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(proc.wait(), timeout=duration)
+        except asyncio.TimeoutError:
             pass
+        finally:
+            # Stop the tone on timeout and also when we are cancelled
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+
+    async def test_all(self):
+        """Test every output, overlapping outputs on different sound cards"""
+        # Outputs sharing a card are tested in turn so their tones don't mix
+        cards = {}
+        for name, info in self.outputs.items():
+            # Sink nodes name their PipeWire device; fall back to the ALSA card
+            props = info.get("props", {})
+            card = props.get("device.id", props.get("api.alsa.pcm.card", name))
+            cards.setdefault(card, []).append(name)
+
+        await asyncio.gather(*(self._test_outputs(names) for names in cards.values()))
+
+    async def _test_outputs(self, names: List[str]):
+        """Test outputs one after another"""
+        for name in names:
+            await self.test_output(name)
 
     async def interactive_mode(self):
         """Interactive testing mode"""
@@ -109,59 +200,99 @@ class AudioTester:
             "Standalone Mode" if self.mode == "standalone" else "Distributed Mode"
         )
         print(f"\nBluebard Audio Tester ({mode_str})")
-        print("\nCommands:")
-        print("d: Show available audio devices")
-        print("b: Show connected Bluetooth devices")
-        print("r <mac> <device>: Route Bluetooth to device")
-        print("a <mac> <device>: Add another output to existing route")
-        print("v <device> <0-100>: Set device volume")
-        print("t <device>: Test audio output")
-        print("h: Show this help")
-        print("q: Quit")
+        await self.show_help()
 
         while True:
             try:
-                cmd = input("\n> ").strip().split()
-                if not cmd:
-                    continue
-
-                if cmd[0] == "q":
-                    break
-                elif cmd[0] == "d":
-                    await self.show_outputs()
-                elif cmd[0] == "b":
-                    await self.show_devices()
-                elif cmd[0] == "r" and len(cmd) == 3:
-                    await self.route_audio(cmd[1], cmd[2], add_to_existing=False)
-                elif cmd[0] == "a" and len(cmd) == 3:
-                    await self.route_audio(cmd[1], cmd[2], add_to_existing=True)
-                elif cmd[0] == "v" and len(cmd) == 3:
-                    await self.set_output_volume(cmd[1], float(cmd[2]))
-                elif cmd[0] == "t" and len(cmd) == 2:
-                    await self.test_output(cmd[1])
-                elif cmd[0] == "h":
-                    print("\nCommands:")
-                    print("d: Show available audio devices")
-                    print("b: Show connected Bluetooth devices")
-                    print("r <mac> <device>: Route Bluetooth to device")
-                    print("a <mac> <device>: Add another output to existing route")
-                    print("v <device> <0-100>: Set device volume")
-                    print("t <device>: Test audio output")
-                    print("h: Show this help")
-                    print("q: Quit")
-                else:
-                    print("Unknown command. Type 'h' for help.")
+                cmd = await self._prompt()
+            except EOFError:
+                break
+            if not cmd:
+                continue
+            if cmd[0] == "q":
+                break
+
+            # Bad input is reported without raising
+            handler, nargs = self._commands.get(cmd[0], (None, None))
+            if handler is None:
+                print("Unknown command. Type 'h' for help.")
+                continue
+            if len(cmd) - 1 != nargs:
+                print(
+                    f"Usage: '{cmd[0]}' takes {nargs} argument(s). Type 'h' for help."
+                )
+                continue
+
+            try:
+                await handler(*cmd[1:])
+            except asyncio.CancelledError:
+                # Ctrl+C arrives as cancellation; let main() shut down
+                raise
             except Exception as e:
-                self.logger.error(f"Command failed: {e}")
+                self.logger.error("Command failed: %s", e)
+
+    async def show_help(self):
+        """Show the interactive commands"""
+        print(HELP)
+
+    async def _prompt(self) -> List[str]:
+        """Read a command without blocking background tasks"""
+        if self._lines is None:
+            self._lines = asyncio.Queue()
+            reader = threading.Thread(
+                target=self._read_stdin,
+                args=(asyncio.get_running_loop(),),
+                daemon=True,
+            )
+            reader.start()
+
+        print("\n> ", end="", flush=True)
+        line = await self._lines.get()
+        if line is None:
+            raise EOFError
+        return line.strip().split()
+
+    def _read_stdin(self, loop: asyncio.AbstractEventLoop):
+        """Pass stdin lines to the event loop, run in a daemon thread
+
+        A daemon thread never holds up shutdown (an executor thread blocked
+        in input() would), and os.read avoids sys.stdin's buffer lock, which
+        interpreter shutdown would otherwise contend for.
+        """
+
+        def post(line: Optional[str]) -> bool:
+            try:
+                loop.call_soon_threadsafe(self._lines.put_nowait, line)
+                return True
+            except RuntimeError:  # Event loop already closed
+                return False
+
+        buf = b""
+        while True:
+            try:
+                chunk = os.read(sys.stdin.fileno(), 4096)
+            except OSError:
+                chunk = b""
+            if not chunk:
+                break
+            *lines, buf = (buf + chunk).split(b"\n")
+            for line in lines:
+                if not post(line.decode(errors="replace")):
+                    return
+        if buf:
+            post(buf.decode(errors="replace"))
+        post(None)
 
     async def cleanup(self):
         """Clean up resources"""
-        # Reset all volumes
-        for output in self.outputs:
-            try:
-                await self.set_output_volume(output, 0)
-            except Exception as e:
-                self.logger.error(f"Failed to reset {output} volume: {e}")
+        # Reset all volumes at once
+        results = await asyncio.gather(
+            *(self.set_output_volume(output, 0) for output in self.outputs),
+            return_exceptions=True,
+        )
+        for output, result in zip(self.outputs, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to reset %s volume: %s", output, result)
 
         await self.bluetooth.cleanup()
         await self.audio.cleanup()
@@ -170,19 +301,30 @@ class AudioTester:
 
 async def main():
     """Main test function"""
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     tester = AudioTester()
 
     try:
         await tester.setup()
         await tester.interactive_mode()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run turns Ctrl+C into cancelling this task
         print("\nShutting down...")
     except Exception as e:
-        logging.error(f"Test failed: {e}")
+        logging.error("Test failed: %s", e)
     finally:
         await tester.cleanup()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Configure logging once for the process, not on each main() call
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop not installed, use the default loop
+        pass
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass  # Raised after main() has shut down on Python < 3.11